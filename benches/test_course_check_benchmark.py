@@ -0,0 +1,249 @@
+import random
+import re
+from copy import deepcopy
+
+import pytest
+
+from sportorg.common.otime import OTime
+from sportorg.models.memory import (
+    Course,
+    CourseControl,
+    Race,
+    ResultSportident,
+    Split,
+    new_event,
+    race,
+)
+
+RESULT_COUNT = 2000
+CONTROL_COUNT = 30
+
+
+def _legacy_check(self, course):
+    """ResultSportident.check() before the course matcher"""
+    obj = race()
+    controls = course.controls
+    course_index = 0
+    count_controls = len(controls)
+    if count_controls == 0:
+        return True
+
+    # list of indexes, coincide with course, used for mixed course order
+    recognized_indexes = []
+
+    # invalidate all splits before check
+    for i in self.splits:
+        i.is_correct = False
+        i.has_penalty = True
+        i.course_index = -1
+
+    ignore_punches_before_start = obj.get_setting("ignore_punches_before_start", False)
+
+    optional_controls_taken = set()
+
+    for i in range(len(self.splits)):
+        try:
+            split = self.splits[i]
+
+            # ignore splits before start (not cleaned card or unintentional punches before start)
+            if ignore_punches_before_start and split.time < self.get_start_time():
+                continue
+
+            template = str(controls[course_index].code)
+            cur_code = split.code
+
+            list_exists = False
+            list_contains = False
+            ind_begin = template.find("(")
+            ind_end = template.find(")")
+            if ind_begin > 0 and ind_end > 0:
+                list_exists = True
+                # any control from the list e.g. '%(31,32,35-45)'
+                arr = re.split(r"\s*,\s*", template[ind_begin + 1 : ind_end])
+                for cp in arr:
+                    cp_range = re.split(r"\s*-\s*", cp)
+                    if int(cur_code) == int(cp_range[0]):
+                        list_contains = True
+                    elif len(cp_range) > 1:
+                        if int(cur_code) > int(cp_range[0]) and int(cur_code) <= int(
+                            cp_range[len(cp_range) - 1]
+                        ):
+                            list_contains = True
+
+            if template.find("%") > -1:
+                # non-unique control
+                if not list_exists or list_contains:
+                    # any control '%' or '%(31,32,33)' or '31%'
+                    split.is_correct = True
+                    split.has_penalty = False
+                    recognized_indexes.append(i)
+                    split.course_index = course_index
+                    course_index += 1
+
+            elif template.find("*") > -1:
+                # unique control '*' or '*(31,32,33)' or '31*'
+                if list_exists and not list_contains:
+                    # not in list
+                    continue
+                # test previous splits
+                is_unique = True
+                course_index_current = -1
+                for j in range(i):
+                    prev_split = self.splits[j]
+
+                    if prev_split.is_correct:
+                        course_index_current += 1
+
+                    if prev_split.code == cur_code and j in recognized_indexes:
+                        if (
+                            course_index_current < 0
+                            or str(controls[course_index_current].code).find("*") < 0
+                        ):
+                            # check only free order controls to be duplicated
+                            continue
+
+                        is_unique = False
+                        break
+                if is_unique:
+                    split.is_correct = True
+                    split.has_penalty = False
+                    recognized_indexes.append(i)
+                    split.course_index = course_index
+                    course_index += 1
+
+            elif template.find("?") > -1:
+                # optional control '?' or '?(31,32,33)' or '31?'
+                if cur_code in optional_controls_taken:
+                    continue
+
+                if not list_exists or list_contains:
+                    # any control '?' or '?(31,32,33)' or '31?'
+                    split.is_correct = True
+                    split.has_penalty = False
+                    recognized_indexes.append(i)
+                    optional_controls_taken.add(cur_code)
+                    split.course_index = course_index
+
+            else:
+                # simple pre-ordered control '31 989' or '31(31,32,33) 989'
+                if list_exists:
+                    # control with optional codes '31(31,32,33) 989'
+                    if list_contains:
+                        split.is_correct = True
+                        recognized_indexes.append(i)
+
+                        correct_code = (
+                            str(controls[course_index].code).split("(")[0].strip()
+                        )
+                        if split.code == correct_code:
+                            split.has_penalty = False
+
+                        split.course_index = course_index
+                        course_index += 1
+                else:
+                    # just cp '31 989'
+                    is_equal = str(cur_code) == controls[course_index].code
+                    if is_equal:
+                        split.is_correct = True
+                        split.has_penalty = False
+                        recognized_indexes.append(i)
+                        split.course_index = course_index
+                        course_index += 1
+
+            if course_index == count_controls:
+                return True
+
+        except KeyError:
+            return False
+
+    return False
+
+
+def _course(codes):
+    course = Course()
+    for code in codes:
+        control = CourseControl()
+        control.code = code
+        course.controls.append(control)
+    return course
+
+
+def _courses():
+    rnd = random.Random(1)
+    plain = [str(code) for code in rnd.sample(range(31, 100), CONTROL_COUNT)]
+    with_lists = list(plain)
+    for i in range(0, CONTROL_COUNT, 5):
+        with_lists[i] = f"{plain[i]}({plain[i]},{int(plain[i]) + 100})"
+    free_order = ["*(31-99)"] * (CONTROL_COUNT - 2) + ["%", "100"]
+    mixed = plain[:10] + ["*"] * 10 + ["%(31,32,40-60)"] * 5 + plain[25:]
+    optional = plain[: CONTROL_COUNT - 2] + ["?(31-60)", "?"]
+    return [
+        _course(codes) for codes in (plain, with_lists, free_order, mixed, optional)
+    ]
+
+
+def _results(courses):
+    rnd = random.Random(2)
+    results = []
+    for i in range(RESULT_COUNT):
+        course = courses[i % len(courses)]
+        codes = []
+        for control in course.controls:
+            code = str(control.code).split("(")[0].strip()
+            if not code.isdigit():
+                code = str(rnd.randint(31, 99))
+            codes.append(code)
+        # mispunches, extra and repeated punches
+        for _ in range(rnd.randint(0, 3)):
+            action = rnd.randint(0, 2)
+            position = rnd.randrange(len(codes))
+            if action == 0:
+                codes[position] = str(rnd.randint(31, 130))
+            elif action == 1:
+                codes.insert(position, str(rnd.randint(31, 99)))
+            else:
+                del codes[position]
+        result = ResultSportident()
+        for j, code in enumerate(codes):
+            split = Split()
+            split.code = code
+            split.time = OTime(hour=10, minute=j)
+            result.splits.append(split)
+        results.append((result, course))
+    return results
+
+
+def _state(result):
+    return [
+        (split.is_correct, split.has_penalty, split.course_index)
+        for split in result.splits
+    ]
+
+
+def _check_all(results, check):
+    return [(check(result, course), _state(result)) for result, course in results]
+
+
+@pytest.fixture(scope="module")
+def results():
+    new_event([Race()])
+    return _results(_courses())
+
+
+def test_check_matches_legacy(results):
+    legacy = _check_all(deepcopy(results), _legacy_check)
+    assert any(is_ok for is_ok, _ in legacy)
+    assert not all(is_ok for is_ok, _ in legacy)
+    assert _check_all(results, ResultSportident.check) == legacy
+
+
+def test_check_legacy(benchmark, results):
+    benchmark.pedantic(
+        _check_all, args=(results, _legacy_check), rounds=3, iterations=1
+    )
+
+
+def test_check(benchmark, results):
+    benchmark.pedantic(
+        _check_all, args=(results, ResultSportident.check), rounds=3, iterations=1
+    )
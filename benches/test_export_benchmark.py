@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from sportorg.libs.iof.generator import write_result_list
+from sportorg.models.memory import new_event
+from sportorg.models.result.result_tools import recalculate_results
+from sportorg.modules.sfr.sfrxexporter import export_sfrx
+
+import test_race_load_benchmark
+
+PERSON_COUNT = 10000
+
+
+@pytest.fixture(scope="module")
+def export_race():
+    obj = test_race_load_benchmark._create_race(PERSON_COUNT)
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True, rebuild_course=True)
+    recalculate_results()
+    return obj
+
+
+def test_export_sfrx(benchmark, export_race, tmp_path):
+    file_name = tmp_path / "race.sfrx"
+    assert benchmark(export_sfrx, str(file_name))
+    with open(file_name, encoding="utf-8") as f:
+        rows = [line for line in f if line.startswith("c")]
+    assert len(rows) == PERSON_COUNT
+
+
+def test_export_iof_result_list(benchmark, export_race):
+    def export():
+        f = io.BytesIO()
+        write_result_list(f, export_race, creator="benchmark")
+        return f.getvalue()
+
+    data = benchmark(export)
+    assert data.count(b"<PersonResult>") == PERSON_COUNT
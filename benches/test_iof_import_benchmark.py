@@ -0,0 +1,37 @@
+import pytest
+
+from sportorg.libs.iof.generator import write_entry_list, write_result_list
+from sportorg.models.memory import Race, new_event, race
+from sportorg.models.result.result_tools import recalculate_results
+from sportorg.modules.iof.iof_xml import import_from_iof
+
+import test_race_load_benchmark
+
+PERSON_COUNT = 20000
+
+
+@pytest.fixture(scope="module")
+def iof_files(tmp_path_factory):
+    obj = test_race_load_benchmark._create_race(PERSON_COUNT)
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True, rebuild_course=True)
+    recalculate_results()
+    path = tmp_path_factory.mktemp("iof")
+    files = {"entry": path / "entry.xml", "result": path / "result.xml"}
+    with open(files["entry"], "wb") as f:
+        write_entry_list(f, obj, creator="benchmark")
+    with open(files["result"], "wb") as f:
+        write_result_list(f, obj, creator="benchmark")
+    return files
+
+
+def _setup():
+    new_event([Race()])
+
+
+@pytest.mark.parametrize("list_name", ["entry", "result"])
+def test_import_iof(benchmark, iof_files, list_name):
+    benchmark.pedantic(
+        import_from_iof, args=(iof_files[list_name],), setup=_setup, rounds=3
+    )
+    assert len(race().persons) == PERSON_COUNT
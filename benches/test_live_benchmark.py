@@ -0,0 +1,63 @@
+import pytest
+
+from sportorg.common.otime import OTime
+from sportorg.models.memory import (
+    Group,
+    Organization,
+    Person,
+    Race,
+    ResultSportident,
+    new_event,
+)
+from sportorg.modules.live.live import LiveClient
+
+GROUP_COUNT = 50
+ORGANIZATION_COUNT = 200
+
+
+def _create_race(person_count):
+    obj = Race()
+    for i in range(ORGANIZATION_COUNT):
+        organization = Organization()
+        organization.name = f"Team {i}"
+        obj.organizations.append(organization)
+
+    for i in range(GROUP_COUNT):
+        group = Group()
+        group.name = f"Group {i}"
+        obj.groups.append(group)
+
+    for i in range(person_count):
+        person = Person()
+        person.name = f"Name {i}"
+        person.set_bib_without_indexing(i + 1)
+        person.set_card_number_without_indexing(100000 + i)
+        person.group = obj.groups[i % GROUP_COUNT]
+        person.organization = obj.organizations[i % ORGANIZATION_COUNT]
+        person.start_time = OTime(hour=10, minute=i % 120)
+        obj.persons.append(person)
+
+        result = ResultSportident()
+        result.person = person
+        result.card_number = person.card_number
+        result.finish_time = OTime(hour=11, minute=i % 60)
+        obj.results.append(result)
+
+    obj.set_setting("live_enabled", True)
+    obj.set_setting("live_urls", ["http://localhost"])
+    obj.set_setting("live_results_enabled", True)
+    obj.set_setting("live_cp_enabled", True)
+    return obj
+
+
+@pytest.mark.parametrize("person_count", [1000, 10000])
+def test_live_send_result(benchmark, person_count):
+    obj = _create_race(person_count)
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True)
+    client = LiveClient()
+    result = obj.results[person_count // 2]
+
+    # the live thread is not started, only the enqueue is measured,
+    # repeated uploads of the result are coalesced in the queue
+    benchmark(client.send, result)
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+try:
+    from PySide6.QtCore import Qt
+except ModuleNotFoundError:
+    from PySide2.QtCore import Qt
+
+from sportorg.common.otime import OTime
+from sportorg.gui.tabs.memory_model import PersonMemoryModel
+from sportorg.models.memory import Group, Organization, Person, Race, new_event
+
+PERSON_COUNT = 20000
+VISIBLE_ROWS = 40
+
+
+@pytest.fixture(scope="module")
+def model():
+    rnd = random.Random(1)
+    obj = Race()
+    for i in range(20):
+        group = Group()
+        group.name = f"Group {i}"
+        obj.groups.append(group)
+        organization = Organization()
+        organization.name = f"Team {i}"
+        obj.organizations.append(organization)
+    for i in range(PERSON_COUNT):
+        person = Person()
+        person.surname = f"Surname {rnd.randint(0, PERSON_COUNT)}"
+        person.name = f"Name {i}"
+        person.set_bib_without_indexing(i + 1)
+        person.group = obj.groups[i % 20]
+        person.organization = obj.organizations[rnd.randint(0, 19)]
+        person.start_time = OTime(hour=11, minute=i % 60)
+        obj.persons.append(person)
+    new_event([obj])
+    return PersonMemoryModel()
+
+
+def _show_page(model, first_row):
+    for row in range(first_row, first_row + VISIBLE_ROWS):
+        for column in range(model.columnCount()):
+            model.data(model.index(row, column), Qt.DisplayRole)
+
+
+def test_refresh_and_show_page(benchmark, model):
+    def refresh():
+        model.init_cache()
+        _show_page(model, PERSON_COUNT - VISIBLE_ROWS)
+
+    benchmark(refresh)
+    assert model.rowCount() == PERSON_COUNT
+
+
+def test_sort_columns(benchmark, model):
+    def sort():
+        for column in (0, 4, 5, 8):
+            model.sort(column, Qt.AscendingOrder)
+        _show_page(model, 0)
+
+    benchmark.pedantic(sort, rounds=5, iterations=1)
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from sportorg.common.otime import OTime
+from sportorg.models.memory import (
+    Course,
+    CourseControl,
+    Group,
+    Organization,
+    Person,
+    Race,
+    ResultSportident,
+    Split,
+    new_event,
+)
+from sportorg.models.result.result_tools import recalculate_results
+from sportorg.modules.backup import json
+
+PERSON_COUNT = 10000
+GROUP_COUNT = 50
+ORGANIZATION_COUNT = 200
+CONTROL_COUNT = 10
+
+
+def _create_race(person_count):
+    rnd = random.Random(1)
+    obj = Race()
+    for i in range(ORGANIZATION_COUNT):
+        organization = Organization()
+        organization.name = f"Team {i}"
+        obj.organizations.append(organization)
+
+    for i in range(GROUP_COUNT):
+        course = Course()
+        course.set_name_without_indexing(f"Course {i}")
+        for code in rnd.sample(range(31, 100), CONTROL_COUNT):
+            control = CourseControl()
+            control.code = str(code)
+            course.controls.append(control)
+        obj.courses.append(course)
+
+        group = Group()
+        group.name = f"Group {i}"
+        group.course = course
+        obj.groups.append(group)
+
+    for i in range(person_count):
+        person = Person()
+        person.name = f"Name {i}"
+        person.surname = f"Surname {i}"
+        person.set_bib_without_indexing(i + 1)
+        person.set_card_number_without_indexing(100000 + i)
+        person.group = obj.groups[i % GROUP_COUNT]
+        person.organization = obj.organizations[i % ORGANIZATION_COUNT]
+        person.start_time = OTime(hour=10, minute=i % 120)
+        obj.persons.append(person)
+
+        result = ResultSportident()
+        result.person = person
+        result.card_number = person.card_number
+        split_time = person.start_time
+        for control in person.group.course.controls:
+            split_time = split_time + OTime(sec=rnd.randint(60, 600))
+            split = Split()
+            split.code = control.code
+            split.time = split_time
+            result.splits.append(split)
+        result.finish_time = split_time + OTime(sec=rnd.randint(10, 60))
+        obj.results.append(result)
+
+    return obj
+
+
+@pytest.fixture(scope="module")
+def race_file(tmp_path_factory):
+    obj = _create_race(PERSON_COUNT)
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True, rebuild_course=True)
+    recalculate_results()
+    file_name = tmp_path_factory.mktemp("race") / "race.json"
+    with open(file_name, "w", encoding="utf-8") as f:
+        json.dump(f)
+    return file_name
+
+
+def _get_races_from_file(file_name):
+    with open(file_name, encoding="utf-8") as f:
+        return json.get_races_from_file(f)
+
+
+def _load(file_name):
+    with open(file_name, encoding="utf-8") as f:
+        json.load(f)
+
+
+def test_get_races_from_file(benchmark, race_file):
+    event, _ = benchmark.pedantic(
+        _get_races_from_file, args=(race_file,), rounds=3, iterations=1
+    )
+    assert len(event[0].persons) == PERSON_COUNT
+    assert len(event[0].results) == PERSON_COUNT
+    assert len(event[0].person_index_bib) == PERSON_COUNT
+
+
+def test_load_race(benchmark, race_file):
+    benchmark.pedantic(_load, args=(race_file,), rounds=3, iterations=1)
@@ -0,0 +1,65 @@
+import time
+
+import pytest
+
+try:
+    from PySide6.QtCore import QCoreApplication
+except ModuleNotFoundError:
+    from PySide2.QtCore import QCoreApplication
+
+from sportorg.modules.readout.fake import FakeReaderClient
+from sportorg.modules.readout.reader import reader_dispatcher
+
+STATION_COUNT = 4
+CARD_COUNT = 200
+PUNCHES = [(31 + i, 60000 * (i + 1)) for i in range(20)]
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def client(app):
+    client = FakeReaderClient(station_count=STATION_COUNT)
+    client.results = []
+    client.set_call(lambda result: client.results.append(result))
+    client.start()
+    yield client
+    client.stop()
+    client._wait_stopped()
+    reader_dispatcher.stop()
+    client.results.clear()
+
+
+def _wait_results(app, client, count):
+    deadline = time.monotonic() + 10
+    while len(client.results) < count and time.monotonic() < deadline:
+        app.processEvents()
+    assert len(client.results) == count
+
+
+def test_readout_latency(benchmark, app, client):
+    """From the card written by the device to the result in the callback"""
+    driver = client.drivers["fake0"]
+
+    def readout():
+        count = len(client.results) + 1
+        driver.send_card(1, PUNCHES, finish=PUNCHES[-1][1])
+        _wait_results(app, client, count)
+
+    benchmark(readout)
+
+
+def test_readout_throughput(benchmark, app, client):
+    """CARD_COUNT cards from STATION_COUNT stations at once"""
+
+    def readout():
+        count = len(client.results) + CARD_COUNT
+        drivers = list(client.drivers.values())
+        for i in range(CARD_COUNT):
+            drivers[i % STATION_COUNT].send_card(i, PUNCHES, finish=PUNCHES[-1][1])
+        _wait_results(app, client, count)
+
+    benchmark(readout)
@@ -0,0 +1,62 @@
+import pytest
+
+from sportorg.common.otime import OTime
+from sportorg.models.memory import (
+    Group,
+    Organization,
+    Person,
+    Race,
+    RaceType,
+    ResultManual,
+    new_event,
+    race,
+)
+from sportorg.models.result.result_tools import recalculate_results
+
+TEAM_COUNT = 600
+LEG_COUNT = 4
+
+
+@pytest.fixture(scope="module")
+def relay_race():
+    obj = Race()
+    group = Group()
+    group.name = "Relay"
+    obj.groups.append(group)
+    new_event([obj])
+    group.set_type(RaceType.RELAY)
+    obj.data.relay_leg_count = LEG_COUNT
+    for team in range(1, TEAM_COUNT + 1):
+        organization = Organization()
+        organization.name = f"Team {team}"
+        obj.organizations.append(organization)
+        finish = OTime(hour=10)
+        for leg in range(1, LEG_COUNT + 1):
+            person = Person()
+            person.surname = f"Leg {leg}"
+            person.group = group
+            person.organization = organization
+            person.set_bib_without_indexing(leg * 1000 + team)
+            if leg == 1:
+                person.start_time = OTime(hour=10)
+            obj.persons.append(person)
+
+            finish = finish + OTime(minute=30, sec=team % 60)
+            result = ResultManual()
+            result.person = person
+            result.finish_time = finish
+            result.penalty_time = OTime(sec=leg)
+            obj.results.append(result)
+    obj.rebuild_indexes(rebuild_person=True)
+    return obj
+
+
+def test_relay_recalculation(benchmark, relay_race):
+    benchmark.pedantic(
+        recalculate_results,
+        kwargs={"recheck_results": False},
+        rounds=3,
+        iterations=1,
+    )
+    assert len(race().relay_teams) == TEAM_COUNT
+    assert race().relay_teams[0].get_is_status_ok()
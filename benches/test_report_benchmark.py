@@ -0,0 +1,45 @@
+import pytest
+
+from sportorg.models.memory import new_event
+from sportorg.models.report import ReportData
+from sportorg.models.result.result_tools import recalculate_results
+
+import test_race_load_benchmark
+
+RESULT_COUNT = 20000
+GROUP_COUNT = 200
+SELECTED_GROUP_COUNT = 50
+
+
+@pytest.fixture(scope="module")
+def report_race():
+    group_count = test_race_load_benchmark.GROUP_COUNT
+    test_race_load_benchmark.GROUP_COUNT = GROUP_COUNT
+    try:
+        obj = test_race_load_benchmark._create_race(RESULT_COUNT)
+    finally:
+        test_race_load_benchmark.GROUP_COUNT = group_count
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True, rebuild_course=True)
+    recalculate_results()
+    return obj
+
+
+def _group_names(obj):
+    return [group.name for group in obj.groups[::4]][:SELECTED_GROUP_COUNT]
+
+
+def test_report_data_selected_groups(benchmark, report_race):
+    selection = {"group_list": _group_names(report_race)}
+
+    def build():
+        return ReportData().races_to_dict([report_race], selection)
+
+    data = benchmark(build)[0]
+    assert len(data["groups"]) == SELECTED_GROUP_COUNT
+    assert len(data["persons"]) == RESULT_COUNT * SELECTED_GROUP_COUNT // GROUP_COUNT
+
+
+def test_to_dict_partial_selected_groups(benchmark, report_race):
+    data = benchmark(report_race.to_dict_partial, group_list=_group_names(report_race))
+    assert len(data["results"]) == RESULT_COUNT * SELECTED_GROUP_COUNT // GROUP_COUNT
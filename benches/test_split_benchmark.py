@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from sportorg.common.otime import OTime
+from sportorg.models.memory import (
+    Course,
+    CourseControl,
+    Group,
+    Person,
+    Race,
+    ResultSportident,
+    Split,
+    new_event,
+)
+from sportorg.models.result.result_tools import recalculate_results
+from sportorg.models.result.split_calculation import GroupSplits
+
+CONTROL_COUNT = 40
+PERSON_COUNT = 300
+
+
+class LegacyGroupSplits(GroupSplits):
+    """Previous path: sort all runners twice for every control"""
+
+    def set_places(self):
+        for i in range(self.cp_count):
+            self.sort_by_leg(i)
+            self.set_places_for_leg(i)
+            if not len(self.person_splits):
+                continue
+            self.set_leg_leader(i, self.person_splits[0])
+            self.sort_by_leg(i, relative=True)
+            self.set_places_for_leg(i, relative=True)
+
+
+@pytest.fixture(scope="module")
+def splits_race():
+    rnd = random.Random(1)
+    obj = Race()
+    course = Course()
+    course.set_name_without_indexing("Course")
+    for code in range(31, 31 + CONTROL_COUNT):
+        control = CourseControl()
+        control.code = str(code)
+        course.controls.append(control)
+    obj.courses.append(course)
+    group = Group()
+    group.name = "Group"
+    group.course = course
+    obj.groups.append(group)
+
+    for i in range(PERSON_COUNT):
+        person = Person()
+        person.name = f"Name {i}"
+        person.set_bib_without_indexing(i + 1)
+        person.group = group
+        person.start_time = OTime(hour=10, minute=i % 120)
+        obj.persons.append(person)
+
+        result = ResultSportident()
+        result.person = person
+        split_time = person.start_time
+        for control in course.controls:
+            split_time = split_time + OTime(sec=rnd.randint(60, 600))
+            split = Split()
+            split.code = control.code
+            split.time = split_time
+            result.splits.append(split)
+        result.finish_time = split_time + OTime(sec=rnd.randint(10, 60))
+        obj.results.append(result)
+
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True, rebuild_course=True)
+    recalculate_results()
+    return obj
+
+
+def test_group_splits_matrix(benchmark, splits_race):
+    group = splits_race.groups[0]
+    group_splits = benchmark(lambda: GroupSplits(splits_race, group).generate())
+    assert len(group_splits.person_splits) == PERSON_COUNT
+
+
+def test_group_splits_legacy(benchmark, splits_race):
+    group = splits_race.groups[0]
+    group_splits = benchmark(lambda: LegacyGroupSplits(splits_race, group).generate())
+    assert len(group_splits.person_splits) == PERSON_COUNT
@@ -0,0 +1,62 @@
+import pytest
+from jinja2 import FileSystemLoader
+
+from sportorg import settings
+from sportorg.common.template import get_template, stream_template
+from sportorg.libs.template import template
+from sportorg.models.memory import new_event
+from sportorg.models.result.result_tools import recalculate_results
+
+from test_race_load_benchmark import _create_race
+
+RESULT_COUNT = 10000
+TEMPLATE_PATH = "reports/1_results.html"
+
+
+@pytest.fixture(scope="module")
+def race_dict():
+    obj = _create_race(RESULT_COUNT)
+    new_event([obj])
+    obj.rebuild_indexes(rebuild_person=True, rebuild_course=True)
+    recalculate_results()
+    return obj.to_dict()
+
+
+def _context(race_dict):
+    return {
+        "race": race_dict,
+        "races": [race_dict],
+        "current_race": 0,
+        "selected": {"persons": []},
+    }
+
+
+def test_render_results_report(benchmark, race_dict, tmp_path):
+    file_name = tmp_path / "results.html"
+
+    def render():
+        with open(file_name, "w", encoding="utf-8", newline="") as file:
+            stream_template(get_template(TEMPLATE_PATH), **_context(race_dict)).dump(
+                file
+            )
+
+    benchmark(render)
+    assert file_name.stat().st_size > RESULT_COUNT
+
+
+def test_render_results_report_uncached(benchmark, race_dict):
+    """Previous pipeline for comparison: a new environment per report,
+    json.dumps for tojson, whole text in memory
+    """
+
+    def render():
+        env = template.create_environment(
+            loader=FileSystemLoader(settings.template_dir())
+        )
+        env.policies["json.dumps_function"] = None
+        env.filters["compress"] = lambda data: template.base64.b64encode(
+            template.gzip.compress(data.encode())
+        ).decode()
+        return env.get_template(TEMPLATE_PATH).render(**_context(race_dict))
+
+    assert len(benchmark(render)) > RESULT_COUNT